@@ -0,0 +1,1106 @@
+"""
+Static opcode tables, generated by `freeze_opcodes.py` from `data/opcodes.csv` and
+`data/selection.csv`. Do not edit by hand, re-run the generator after changing the CSVs.
+"""
+
+OPCODES = \
+{'0x00': {'Value': '0x00',
+          'Mnemonic': 'STOP',
+          'Gas Used': '0',
+          'Subset': 'zero',
+          'Removed from stack': '0',
+          'Added to stack': '0',
+          'Notes': 'Halts execution.',
+          'Formula Notes': ''},
+ '0x01': {'Value': '0x01',
+          'Mnemonic': 'ADD',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Addition operation',
+          'Formula Notes': ''},
+ '0x02': {'Value': '0x02',
+          'Mnemonic': 'MUL',
+          'Gas Used': '5',
+          'Subset': 'low',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Multiplication operation.',
+          'Formula Notes': ''},
+ '0x03': {'Value': '0x03',
+          'Mnemonic': 'SUB',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Subtraction operation.',
+          'Formula Notes': ''},
+ '0x04': {'Value': '0x04',
+          'Mnemonic': 'DIV',
+          'Gas Used': '5',
+          'Subset': 'low',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Integer division operation.',
+          'Formula Notes': ''},
+ '0x05': {'Value': '0x05',
+          'Mnemonic': 'SDIV',
+          'Gas Used': '5',
+          'Subset': 'low',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Signed integer division operation (truncated).',
+          'Formula Notes': ''},
+ '0x06': {'Value': '0x06',
+          'Mnemonic': 'MOD',
+          'Gas Used': '5',
+          'Subset': 'low',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Modulo remainder operation',
+          'Formula Notes': ''},
+ '0x07': {'Value': '0x07',
+          'Mnemonic': 'SMOD',
+          'Gas Used': '5',
+          'Subset': 'low',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Signed modulo remainder operation.',
+          'Formula Notes': ''},
+ '0x08': {'Value': '0x08',
+          'Mnemonic': 'ADDMOD',
+          'Gas Used': '8',
+          'Subset': 'mid',
+          'Removed from stack': '3',
+          'Added to stack': '1',
+          'Notes': 'Modulo addition operation.',
+          'Formula Notes': ''},
+ '0x09': {'Value': '0x09',
+          'Mnemonic': 'MULMOD',
+          'Gas Used': '8',
+          'Subset': 'mid',
+          'Removed from stack': '3',
+          'Added to stack': '1',
+          'Notes': 'Modulo multiplication operation.',
+          'Formula Notes': ''},
+ '0x0a': {'Value': '0x0a',
+          'Mnemonic': 'EXP',
+          'Gas Used': '(exp == 0) ? 10 : (10 + 50 * (1 + log256(exp)))',
+          'Subset': '',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Exponential operation.',
+          'Formula Notes': 'If exponent is 0, gas used is 10. If exponent is '
+                           'greater than 0, gas used is 10 plus 50 times a '
+                           'factor related to how large the log of the '
+                           'exponent is.'},
+ '0x0b': {'Value': '0x0b',
+          'Mnemonic': 'SIGNEXTEND',
+          'Gas Used': '5',
+          'Subset': 'low',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Extend length of two’s complement signed integer.',
+          'Formula Notes': ''},
+ '0x10': {'Value': '0x10',
+          'Mnemonic': 'LT',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Less-than comparison.',
+          'Formula Notes': ''},
+ '0x11': {'Value': '0x11',
+          'Mnemonic': 'GT',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Greater-than comparison.',
+          'Formula Notes': ''},
+ '0x12': {'Value': '0x12',
+          'Mnemonic': 'SLT',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Signed less-than comparison.',
+          'Formula Notes': ''},
+ '0x13': {'Value': '0x13',
+          'Mnemonic': 'SGT',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Signed greater-than comparison.',
+          'Formula Notes': ''},
+ '0x14': {'Value': '0x14',
+          'Mnemonic': 'EQ',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Equality comparison.',
+          'Formula Notes': ''},
+ '0x15': {'Value': '0x15',
+          'Mnemonic': 'ISZERO',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '1',
+          'Added to stack': '1',
+          'Notes': 'Simple not operator.',
+          'Formula Notes': ''},
+ '0x16': {'Value': '0x16',
+          'Mnemonic': 'AND',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Bitwise AND operation.',
+          'Formula Notes': ''},
+ '0x17': {'Value': '0x17',
+          'Mnemonic': 'OR',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Bitwise OR operation',
+          'Formula Notes': ''},
+ '0x18': {'Value': '0x18',
+          'Mnemonic': 'XOR',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Bitwise XOR operation.',
+          'Formula Notes': ''},
+ '0x19': {'Value': '0x19',
+          'Mnemonic': 'NOT',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '1',
+          'Added to stack': '1',
+          'Notes': 'Bitwise NOT operation.',
+          'Formula Notes': ''},
+ '0x1a': {'Value': '0x1a',
+          'Mnemonic': 'BYTE',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Retrieve single byte from word',
+          'Formula Notes': ''},
+ '0x1b': {'Value': '0x1b',
+          'Mnemonic': 'SHL',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Left shift operation',
+          'Formula Notes': ''},
+ '0x1c': {'Value': '0x1c',
+          'Mnemonic': 'SHR',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Logical right shift operation',
+          'Formula Notes': ''},
+ '0x1d': {'Value': '0x1d',
+          'Mnemonic': 'SAR',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Arithmetic (signed) right shift operation',
+          'Formula Notes': ''},
+ '0x20': {'Value': '0x20',
+          'Mnemonic': 'SHA3',
+          'Gas Used': '30 + 6 * (size of input in words)',
+          'Subset': '',
+          'Removed from stack': '2',
+          'Added to stack': '1',
+          'Notes': 'Compute Keccak-256 hash.',
+          'Formula Notes': '30 is the paid for the operation plus 6 paid for '
+                           'each word (rounded up) for the input data.'},
+ '0x30': {'Value': '0x30',
+          'Mnemonic': 'ADDRESS',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get address of currently executing account.',
+          'Formula Notes': ''},
+ '0x31': {'Value': '0x31',
+          'Mnemonic': 'BALANCE',
+          'Gas Used': '400',
+          'Subset': '',
+          'Removed from stack': '1',
+          'Added to stack': '1',
+          'Notes': 'Get balance of the given account.',
+          'Formula Notes': ''},
+ '0x32': {'Value': '0x32',
+          'Mnemonic': 'ORIGIN',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get execution origination address.',
+          'Formula Notes': ''},
+ '0x33': {'Value': '0x33',
+          'Mnemonic': 'CALLER',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get caller address.',
+          'Formula Notes': ''},
+ '0x34': {'Value': '0x34',
+          'Mnemonic': 'CALLVALUE',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get deposited value by the instruction/transaction '
+                   'responsible for this execution.',
+          'Formula Notes': ''},
+ '0x35': {'Value': '0x35',
+          'Mnemonic': 'CALLDATALOAD',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '1',
+          'Added to stack': '1',
+          'Notes': 'Get input data of current environment.',
+          'Formula Notes': ''},
+ '0x36': {'Value': '0x36',
+          'Mnemonic': 'CALLDATASIZE',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get size of input data in current environment.',
+          'Formula Notes': ''},
+ '0x37': {'Value': '0x37',
+          'Mnemonic': 'CALLDATACOPY',
+          'Gas Used': '3 + 3 * (number of words copied, rounded up)',
+          'Subset': '',
+          'Removed from stack': '3',
+          'Added to stack': '0',
+          'Notes': 'Copy input data in current environment to memory.',
+          'Formula Notes': '2 is paid for the operation plus 3 for each word '
+                           'copied (rounded up).'},
+ '0x38': {'Value': '0x38',
+          'Mnemonic': 'CODESIZE',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get size of code running in current environment.',
+          'Formula Notes': ''},
+ '0x39': {'Value': '0x39',
+          'Mnemonic': 'CODECOPY',
+          'Gas Used': '3 + 3 * (number of words copied, rounded up)',
+          'Subset': '',
+          'Removed from stack': '3',
+          'Added to stack': '0',
+          'Notes': 'Copy code running in current environment to memory.',
+          'Formula Notes': '2 is paid for the operation plus 3 for each word '
+                           'copied (rounded up).'},
+ '0x3a': {'Value': '0x3a',
+          'Mnemonic': 'GASPRICE',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get price of gas in current environment.',
+          'Formula Notes': ''},
+ '0x3b': {'Value': '0x3b',
+          'Mnemonic': 'EXTCODESIZE',
+          'Gas Used': '700',
+          'Subset': 'extcode',
+          'Removed from stack': '1',
+          'Added to stack': '1',
+          'Notes': 'Get size of an account’s code.',
+          'Formula Notes': ''},
+ '0x3c': {'Value': '0x3c',
+          'Mnemonic': 'EXTCODECOPY',
+          'Gas Used': '700 + 3 * (number of words copied, rounded up)',
+          'Subset': '',
+          'Removed from stack': '4',
+          'Added to stack': '0',
+          'Notes': 'Copy an account’s code to memory.',
+          'Formula Notes': '700 is paid for the operation plus 3 for each word '
+                           'copied (rounded up).'},
+ '0x3d': {'Value': '0x3d',
+          'Mnemonic': 'RETURNDATASIZE',
+          'Gas Used': '2',
+          'Subset': '',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Pushes the size of the return data buffer onto the stack',
+          'Formula Notes': ''},
+ '0x3e': {'Value': '0x3e',
+          'Mnemonic': 'RETURNDATACOPY',
+          'Gas Used': '3 + 3 * ceil(amount / 32)',
+          'Subset': '',
+          'Removed from stack': '3',
+          'Added to stack': '0',
+          'Notes': 'This opcode has similar semantics to CALLDATACOPY',
+          'Formula Notes': ' but instead of copying data from the call data',
+          None: [' it copies data from the return data buffer', '']},
+ '0x40': {'Value': '0x40',
+          'Mnemonic': 'BLOCKHASH',
+          'Gas Used': '20',
+          'Subset': '',
+          'Removed from stack': '1',
+          'Added to stack': '1',
+          'Notes': 'Get the hash of one of the 256 most recent complete '
+                   'blocks.',
+          'Formula Notes': ''},
+ '0x41': {'Value': '0x41',
+          'Mnemonic': 'COINBASE',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get the block’s beneficiary address.',
+          'Formula Notes': ''},
+ '0x42': {'Value': '0x42',
+          'Mnemonic': 'TIMESTAMP',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get the block’s timestamp.',
+          'Formula Notes': ''},
+ '0x43': {'Value': '0x43',
+          'Mnemonic': 'NUMBER',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get the block’s number.',
+          'Formula Notes': ''},
+ '0x44': {'Value': '0x44',
+          'Mnemonic': 'DIFFICULTY',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get the block’s difficulty.',
+          'Formula Notes': ''},
+ '0x45': {'Value': '0x45',
+          'Mnemonic': 'GASLIMIT',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get the block’s gas limit.',
+          'Formula Notes': ''},
+ '0x46': {'Value': '0x46',
+          'Mnemonic': 'CHAINID',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get the chain ID',
+          'Formula Notes': None},
+ '0x47': {'Value': '0x47',
+          'Mnemonic': 'SELFBALANCE',
+          'Gas Used': '5',
+          'Subset': 'low',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get balance of currently executing account',
+          'Formula Notes': None},
+ '0x50': {'Value': '0x50',
+          'Mnemonic': 'POP',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '1',
+          'Added to stack': '0',
+          'Notes': 'Remove item from stack.',
+          'Formula Notes': ''},
+ '0x51': {'Value': '0x51',
+          'Mnemonic': 'MLOAD',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '1',
+          'Added to stack': '1',
+          'Notes': 'Load word from memory.',
+          'Formula Notes': ''},
+ '0x52': {'Value': '0x52',
+          'Mnemonic': 'MSTORE',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '0',
+          'Notes': 'Save word to memory',
+          'Formula Notes': ''},
+ '0x53': {'Value': '0x53',
+          'Mnemonic': 'MSTORE8',
+          'Gas Used': '3',
+          'Subset': 'verylow',
+          'Removed from stack': '2',
+          'Added to stack': '0',
+          'Notes': 'Save byte to memory.',
+          'Formula Notes': ''},
+ '0x54': {'Value': '0x54',
+          'Mnemonic': 'SLOAD',
+          'Gas Used': '200',
+          'Subset': '',
+          'Removed from stack': '1',
+          'Added to stack': '1',
+          'Notes': 'Load word from storage',
+          'Formula Notes': ''},
+ '0x55': {'Value': '0x55',
+          'Mnemonic': 'SSTORE',
+          'Gas Used': '((value != 0) && (storage_location == 0)) ? 20000 : '
+                      '5000',
+          'Subset': '',
+          'Removed from stack': '1',
+          'Added to stack': '1',
+          'Notes': 'Save word to storage.',
+          'Formula Notes': '20000 is paid when storage value is set to '
+                           'non-zero from zero. 5000 is paid when the storage '
+                           "value's zeroness remains unchanged or is set to "
+                           'zero.'},
+ '0x56': {'Value': '0x56',
+          'Mnemonic': 'JUMP',
+          'Gas Used': '8',
+          'Subset': 'mid',
+          'Removed from stack': '1',
+          'Added to stack': '0',
+          'Notes': 'Alter the program counter',
+          'Formula Notes': ''},
+ '0x57': {'Value': '0x57',
+          'Mnemonic': 'JUMPI',
+          'Gas Used': '10',
+          'Subset': 'high',
+          'Removed from stack': '2',
+          'Added to stack': '0',
+          'Notes': 'Conditionally alter the program counter.',
+          'Formula Notes': ''},
+ '0x58': {'Value': '0x58',
+          'Mnemonic': 'PC',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get the value of the program counter prior to the '
+                   'increment corresponding to this instruction.',
+          'Formula Notes': ''},
+ '0x59': {'Value': '0x59',
+          'Mnemonic': 'MSIZE',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get the size of active memory in bytes.',
+          'Formula Notes': ''},
+ '0x5a': {'Value': '0x5a',
+          'Mnemonic': 'GAS',
+          'Gas Used': '2',
+          'Subset': 'base',
+          'Removed from stack': '0',
+          'Added to stack': '1',
+          'Notes': 'Get the amount of available gas, including the '
+                   'corresponding reduction for the cost of this instruction.',
+          'Formula Notes': ''},
+ '0x5b': {'Value': '0x5b',
+          'Mnemonic': 'JUMPDEST',
+          'Gas Used': '1',
+          'Subset': '',
+          'Removed from stack': '0',
+          'Added to stack': '0',
+          'Notes': 'Mark a valid destination for jumps',
+          'Formula Notes': ''},
+ '0x60 -- 0x7f': {'Value': '0x60 -- 0x7f',
+                  'Mnemonic': 'PUSH*',
+                  'Gas Used': '3',
+                  'Subset': 'verylow',
+                  'Removed from stack': '0',
+                  'Added to stack': '1',
+                  'Notes': 'Place * byte item on stack. 0 < * <= 32',
+                  'Formula Notes': ''},
+ '0x80 -- 0x8f': {'Value': '0x80 -- 0x8f',
+                  'Mnemonic': 'DUP*',
+                  'Gas Used': '3',
+                  'Subset': 'verylow',
+                  'Removed from stack': '*',
+                  'Added to stack': '* + 1',
+                  'Notes': 'Duplicate *th stack item. 0 < * <= 16',
+                  'Formula Notes': ''},
+ '0x90 -- 0x9f': {'Value': '0x90 -- 0x9f',
+                  'Mnemonic': 'SWAP*',
+                  'Gas Used': '3',
+                  'Subset': 'verylow',
+                  'Removed from stack': '* + 1',
+                  'Added to stack': '* + 1',
+                  'Notes': 'Exchange 1st and (* + 1)th stack items.',
+                  'Formula Notes': ''},
+ '0xa0': {'Value': '0xa0',
+          'Mnemonic': 'LOG0',
+          'Gas Used': '375 + 8 * (number of bytes in log data)',
+          'Subset': '',
+          'Removed from stack': '2',
+          'Added to stack': '0',
+          'Notes': 'Append log record with no topics.',
+          'Formula Notes': '375 is paid for operation plus 8 for each byte in '
+                           'data to be logged.'},
+ '0xa1': {'Value': '0xa1',
+          'Mnemonic': 'LOG1',
+          'Gas Used': '375 + 8 * (number of bytes in log data) + 375',
+          'Subset': '',
+          'Removed from stack': '3',
+          'Added to stack': '0',
+          'Notes': 'Append log record with one topic.',
+          'Formula Notes': '375 is paid for operation plus 8 for each byte in '
+                           'data to be logged plus 375 for the 1 topic to be '
+                           'logged.'},
+ '0xa2': {'Value': '0xa2',
+          'Mnemonic': 'LOG2',
+          'Gas Used': '375 + 8 * (number of bytes in log data) + 2 * 375',
+          'Subset': '',
+          'Removed from stack': '4',
+          'Added to stack': '0',
+          'Notes': 'Append log record with two topics.',
+          'Formula Notes': '375 is paid for operation plus 8 for each byte in '
+                           'data to be logged plus 2 * 375 for the 2 topics to '
+                           'be logged.'},
+ '0xa3': {'Value': '0xa3',
+          'Mnemonic': 'LOG3',
+          'Gas Used': '375 + 8 * (number of bytes in log data) + 3 * 375',
+          'Subset': '',
+          'Removed from stack': '5',
+          'Added to stack': '0',
+          'Notes': 'Append log record with three topics.',
+          'Formula Notes': '375 is paid for operation plus 8 for each byte in '
+                           'data to be logged plus 3 * 375 for the 3 topics to '
+                           'be logged.'},
+ '0xa4': {'Value': '0xa4',
+          'Mnemonic': 'LOG4',
+          'Gas Used': '375 + 8 * (number of bytes in log data) + 4 * 375',
+          'Subset': '',
+          'Removed from stack': '6',
+          'Added to stack': '0',
+          'Notes': 'Append log record with four topics.',
+          'Formula Notes': '375 is paid for operation plus 8 for each byte in '
+                           'data to be logged plus 4 * 375 for the 4 topics to '
+                           'be logged.'},
+ '0xf0': {'Value': '0xf0',
+          'Mnemonic': 'CREATE',
+          'Gas Used': '32000',
+          'Subset': '',
+          'Removed from stack': '3',
+          'Added to stack': '1',
+          'Notes': 'Create a new account with associated code.',
+          'Formula Notes': ''},
+ '0xf1': {'Value': '0xf1',
+          'Mnemonic': 'CALL',
+          'Gas Used': 'Complex -- see yellow paper  Appendix H',
+          'Subset': '',
+          'Removed from stack': '7',
+          'Added to stack': '1',
+          'Notes': 'Message-call into an account.',
+          'Formula Notes': ''},
+ '0xf2': {'Value': '0xf2',
+          'Mnemonic': 'CALLCODE',
+          'Gas Used': 'Complex -- see yellow paper  Appendix H',
+          'Subset': '',
+          'Removed from stack': '7',
+          'Added to stack': '1',
+          'Notes': 'Message-call into this account with an alternative '
+                   'account’s code.',
+          'Formula Notes': ''},
+ '0xf3': {'Value': '0xf3',
+          'Mnemonic': 'RETURN',
+          'Gas Used': '0',
+          'Subset': 'zero',
+          'Removed from stack': '2',
+          'Added to stack': '0',
+          'Notes': 'Halt execution returning output data.',
+          'Formula Notes': ''},
+ '0xf4': {'Value': '0xf4',
+          'Mnemonic': 'DELEGATECALL',
+          'Gas Used': 'Complex -- see yellow paper  Appendix H',
+          'Subset': '',
+          'Removed from stack': '6',
+          'Added to stack': '1',
+          'Notes': 'Message-call into this account with an alternative '
+                   'account’s code, but persisting the current values for '
+                   'sender and value.',
+          'Formula Notes': ''},
+ '0xfd': {'Value': '0xfd',
+          'Mnemonic': 'REVERT',
+          'Gas Used': '',
+          'Subset': '',
+          'Removed from stack': '2',
+          'Added to stack': '0',
+          'Notes': 'End execution',
+          'Formula Notes': ' revert state changes',
+          None: [' return data mem[p…(p+s))', '']},
+ '0xfe': {'Value': '0xfe',
+          'Mnemonic': 'INVALID',
+          'Gas Used': 'NA',
+          'Subset': '',
+          'Removed from stack': 'NA',
+          'Added to stack': 'NA',
+          'Notes': 'Designated invalid instruction.',
+          'Formula Notes': ''},
+ '0xff': {'Value': '0xff',
+          'Mnemonic': 'SELFDESTRUCT',
+          'Gas Used': '5000 + ((create_new_account) ? 25000 : 0)',
+          'Subset': '',
+          'Removed from stack': '1',
+          'Added to stack': '0',
+          'Notes': 'Halt execution and register account for later deletion',
+          'Formula Notes': '5000 for the operation plus 25000 if a new account '
+                           'is also created. A refund of 24000 gas is also '
+                           'added to the refund counter for self-destructing '
+                           'the account.'},
+ '0x60': {'Value': '0x60',
+          'Mnemonic': 'PUSH1',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '03'},
+ '0x61': {'Value': '0x61',
+          'Mnemonic': 'PUSH2',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '0303'},
+ '0x62': {'Value': '0x62',
+          'Mnemonic': 'PUSH3',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '030303'},
+ '0x63': {'Value': '0x63',
+          'Mnemonic': 'PUSH4',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '03030303'},
+ '0x64': {'Value': '0x64',
+          'Mnemonic': 'PUSH5',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '0303030303'},
+ '0x65': {'Value': '0x65',
+          'Mnemonic': 'PUSH6',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '030303030303'},
+ '0x66': {'Value': '0x66',
+          'Mnemonic': 'PUSH7',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '03030303030303'},
+ '0x67': {'Value': '0x67',
+          'Mnemonic': 'PUSH8',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '0303030303030303'},
+ '0x68': {'Value': '0x68',
+          'Mnemonic': 'PUSH9',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '030303030303030303'},
+ '0x69': {'Value': '0x69',
+          'Mnemonic': 'PUSH10',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '03030303030303030303'},
+ '0x6a': {'Value': '0x6a',
+          'Mnemonic': 'PUSH11',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '0303030303030303030303'},
+ '0x6b': {'Value': '0x6b',
+          'Mnemonic': 'PUSH12',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '030303030303030303030303'},
+ '0x6c': {'Value': '0x6c',
+          'Mnemonic': 'PUSH13',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '03030303030303030303030303'},
+ '0x6d': {'Value': '0x6d',
+          'Mnemonic': 'PUSH14',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '0303030303030303030303030303'},
+ '0x6e': {'Value': '0x6e',
+          'Mnemonic': 'PUSH15',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '030303030303030303030303030303'},
+ '0x6f': {'Value': '0x6f',
+          'Mnemonic': 'PUSH16',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '03030303030303030303030303030303'},
+ '0x70': {'Value': '0x70',
+          'Mnemonic': 'PUSH17',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '0303030303030303030303030303030303'},
+ '0x71': {'Value': '0x71',
+          'Mnemonic': 'PUSH18',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '030303030303030303030303030303030303'},
+ '0x72': {'Value': '0x72',
+          'Mnemonic': 'PUSH19',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '03030303030303030303030303030303030303'},
+ '0x73': {'Value': '0x73',
+          'Mnemonic': 'PUSH20',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '0303030303030303030303030303030303030303'},
+ '0x74': {'Value': '0x74',
+          'Mnemonic': 'PUSH21',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '030303030303030303030303030303030303030303'},
+ '0x75': {'Value': '0x75',
+          'Mnemonic': 'PUSH22',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '03030303030303030303030303030303030303030303'},
+ '0x76': {'Value': '0x76',
+          'Mnemonic': 'PUSH23',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '0303030303030303030303030303030303030303030303'},
+ '0x77': {'Value': '0x77',
+          'Mnemonic': 'PUSH24',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '030303030303030303030303030303030303030303030303'},
+ '0x78': {'Value': '0x78',
+          'Mnemonic': 'PUSH25',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '03030303030303030303030303030303030303030303030303'},
+ '0x79': {'Value': '0x79',
+          'Mnemonic': 'PUSH26',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '0303030303030303030303030303030303030303030303030303'},
+ '0x7a': {'Value': '0x7a',
+          'Mnemonic': 'PUSH27',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '030303030303030303030303030303030303030303030303030303'},
+ '0x7b': {'Value': '0x7b',
+          'Mnemonic': 'PUSH28',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '03030303030303030303030303030303030303030303030303030303'},
+ '0x7c': {'Value': '0x7c',
+          'Mnemonic': 'PUSH29',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '0303030303030303030303030303030303030303030303030303030303'},
+ '0x7d': {'Value': '0x7d',
+          'Mnemonic': 'PUSH30',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '030303030303030303030303030303030303030303030303030303030303'},
+ '0x7e': {'Value': '0x7e',
+          'Mnemonic': 'PUSH31',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '03030303030303030303030303030303030303030303030303030303030303'},
+ '0x7f': {'Value': '0x7f',
+          'Mnemonic': 'PUSH32',
+          'Removed from stack': 0,
+          'Added to stack': 1,
+          'Parameter': '0303030303030303030303030303030303030303030303030303030303030303'},
+ '0x80': {'Value': '0x80',
+          'Mnemonic': 'DUP1',
+          'Removed from stack': 1,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x81': {'Value': '0x81',
+          'Mnemonic': 'DUP2',
+          'Removed from stack': 2,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x82': {'Value': '0x82',
+          'Mnemonic': 'DUP3',
+          'Removed from stack': 3,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x83': {'Value': '0x83',
+          'Mnemonic': 'DUP4',
+          'Removed from stack': 4,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x84': {'Value': '0x84',
+          'Mnemonic': 'DUP5',
+          'Removed from stack': 5,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x85': {'Value': '0x85',
+          'Mnemonic': 'DUP6',
+          'Removed from stack': 6,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x86': {'Value': '0x86',
+          'Mnemonic': 'DUP7',
+          'Removed from stack': 7,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x87': {'Value': '0x87',
+          'Mnemonic': 'DUP8',
+          'Removed from stack': 8,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x88': {'Value': '0x88',
+          'Mnemonic': 'DUP9',
+          'Removed from stack': 9,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x89': {'Value': '0x89',
+          'Mnemonic': 'DUP10',
+          'Removed from stack': 10,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x8a': {'Value': '0x8a',
+          'Mnemonic': 'DUP11',
+          'Removed from stack': 11,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x8b': {'Value': '0x8b',
+          'Mnemonic': 'DUP12',
+          'Removed from stack': 12,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x8c': {'Value': '0x8c',
+          'Mnemonic': 'DUP13',
+          'Removed from stack': 13,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x8d': {'Value': '0x8d',
+          'Mnemonic': 'DUP14',
+          'Removed from stack': 14,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x8e': {'Value': '0x8e',
+          'Mnemonic': 'DUP15',
+          'Removed from stack': 15,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x8f': {'Value': '0x8f',
+          'Mnemonic': 'DUP16',
+          'Removed from stack': 16,
+          'Added to stack': 1,
+          'Parameter': None},
+ '0x90': {'Value': '0x90',
+          'Mnemonic': 'SWAP1',
+          'Removed from stack': 2,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x91': {'Value': '0x91',
+          'Mnemonic': 'SWAP2',
+          'Removed from stack': 3,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x92': {'Value': '0x92',
+          'Mnemonic': 'SWAP3',
+          'Removed from stack': 4,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x93': {'Value': '0x93',
+          'Mnemonic': 'SWAP4',
+          'Removed from stack': 5,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x94': {'Value': '0x94',
+          'Mnemonic': 'SWAP5',
+          'Removed from stack': 6,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x95': {'Value': '0x95',
+          'Mnemonic': 'SWAP6',
+          'Removed from stack': 7,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x96': {'Value': '0x96',
+          'Mnemonic': 'SWAP7',
+          'Removed from stack': 8,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x97': {'Value': '0x97',
+          'Mnemonic': 'SWAP8',
+          'Removed from stack': 9,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x98': {'Value': '0x98',
+          'Mnemonic': 'SWAP9',
+          'Removed from stack': 10,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x99': {'Value': '0x99',
+          'Mnemonic': 'SWAP10',
+          'Removed from stack': 11,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x9a': {'Value': '0x9a',
+          'Mnemonic': 'SWAP11',
+          'Removed from stack': 12,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x9b': {'Value': '0x9b',
+          'Mnemonic': 'SWAP12',
+          'Removed from stack': 13,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x9c': {'Value': '0x9c',
+          'Mnemonic': 'SWAP13',
+          'Removed from stack': 14,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x9d': {'Value': '0x9d',
+          'Mnemonic': 'SWAP14',
+          'Removed from stack': 15,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x9e': {'Value': '0x9e',
+          'Mnemonic': 'SWAP15',
+          'Removed from stack': 16,
+          'Added to stack': 0,
+          'Parameter': None},
+ '0x9f': {'Value': '0x9f',
+          'Mnemonic': 'SWAP16',
+          'Removed from stack': 17,
+          'Added to stack': 0,
+          'Parameter': None}}
+
+SELECTION = \
+['0x00',
+ '0x01',
+ '0x02',
+ '0x03',
+ '0x04',
+ '0x05',
+ '0x06',
+ '0x07',
+ '0x08',
+ '0x09',
+ '0x0a',
+ '0x0b',
+ '0x10',
+ '0x11',
+ '0x12',
+ '0x13',
+ '0x14',
+ '0x15',
+ '0x16',
+ '0x17',
+ '0x18',
+ '0x19',
+ '0x1a',
+ '0x1b',
+ '0x1c',
+ '0x1d',
+ '0x30',
+ '0x32',
+ '0x33',
+ '0x34',
+ '0x35',
+ '0x36',
+ '0x37',
+ '0x38',
+ '0x39',
+ '0x3a',
+ '0x3d',
+ '0x3e',
+ '0x41',
+ '0x42',
+ '0x43',
+ '0x44',
+ '0x45',
+ '0x46',
+ '0x47',
+ '0x50',
+ '0x51',
+ '0x52',
+ '0x53',
+ '0x56',
+ '0x57',
+ '0x58',
+ '0x59',
+ '0x5a',
+ '0x5b',
+ '0x60',
+ '0x61',
+ '0x62',
+ '0x63',
+ '0x64',
+ '0x65',
+ '0x66',
+ '0x67',
+ '0x68',
+ '0x69',
+ '0x6a',
+ '0x6b',
+ '0x6c',
+ '0x6d',
+ '0x6e',
+ '0x6f',
+ '0x70',
+ '0x71',
+ '0x72',
+ '0x73',
+ '0x74',
+ '0x75',
+ '0x76',
+ '0x77',
+ '0x78',
+ '0x79',
+ '0x7a',
+ '0x7b',
+ '0x7c',
+ '0x7d',
+ '0x7e',
+ '0x7f',
+ '0x80',
+ '0x81',
+ '0x82',
+ '0x83',
+ '0x84',
+ '0x85',
+ '0x86',
+ '0x87',
+ '0x88',
+ '0x89',
+ '0x8a',
+ '0x8b',
+ '0x8c',
+ '0x8d',
+ '0x8e',
+ '0x8f',
+ '0x90',
+ '0x91',
+ '0x92',
+ '0x93',
+ '0x94',
+ '0x95',
+ '0x96',
+ '0x97',
+ '0x98',
+ '0x99',
+ '0x9a',
+ '0x9b',
+ '0x9c',
+ '0x9d',
+ '0x9e',
+ '0x9f',
+ '0xf3',
+ '0xfd',
+ '0xfe']
@@ -1,5 +1,6 @@
 import csv
 import random
+from functools import lru_cache
 from math import ceil
 
 import constants
@@ -87,7 +88,14 @@ def generate_single_marginal(single_op_pushes, operation, op_count):
 # `bytecode` so far, needed to generate a correct JUMPDEST pc
 # `opcode` - is that of JUMP or JUMPI. If None, will not put the opcode in at all
 def jump_opcode_combo(current_bytecode, opcode):
-  current_pc = len(current_bytecode) // 2
+  return jump_opcode_combo_at(len(current_bytecode) // 2, opcode)
+
+
+# Same as `jump_opcode_combo`, but takes the pc directly. Callers which accumulate bytecode in
+# chunks can pass their running length and skip materializing the bytecode so far. The output
+# only depends on (pc, opcode), so repeated combos at the same pc are served from cache
+@lru_cache(maxsize=None)
+def jump_opcode_combo_at(current_pc, opcode):
   if opcode:
     jumpdest_pc = current_pc + 1 + 3 + 1  # PUSH3, pushed 3 bytes, jump
     return byte_size_push(3, jumpdest_pc) + opcode + '5b'
@@ -96,6 +104,9 @@ def jump_opcode_combo(current_bytecode, opcode):
     return byte_size_push(3, jumpdest_pc) + '5b'
 
 
+# cached: the files never change at runtime and several generators instantiate per process,
+# so parse each file once. Callers treat the result as read-only
+@lru_cache()
 def prepare_opcodes(opcodes_file):
   with open(opcodes_file) as csvfile:
     reader = csv.DictReader(csvfile, delimiter=',', quotechar='"')
@@ -104,6 +115,7 @@ def prepare_opcodes(opcodes_file):
   return _fill_opcodes_push_dup_swap(opcodes)
 
 
+@lru_cache()
 def get_selection(selection_file):
   with open(selection_file) as csvfile:
     reader = csv.DictReader(csvfile, delimiter=' ', quotechar='"')
@@ -117,13 +129,13 @@ def _fill_opcodes_push_dup_swap(opcodes):
   swaps = constants.EVM_SWAPS
 
   pushes = _opcodes_dict_push_dup_swap(pushes, [0] * len(pushes), [1] * len(pushes), ['03' * variant for variant in range(1,33)])
-  opcodes = {**opcodes, **pushes}
+  opcodes.update(pushes)
   # For dups and swaps the removeds/addeds aren't precise. "removed" is how much is required to be on stack
   # so it must be pushed there once. "added" is how much is really added "extra"
   dups = _opcodes_dict_push_dup_swap(dups, range(1, len(dups)), [1] * len(dups), [None] * len(dups))
-  opcodes = {**opcodes, **dups}
+  opcodes.update(dups)
   swaps = _opcodes_dict_push_dup_swap(swaps, range(2, len(swaps)+1), [0] * len(swaps), [None] * len(swaps))
-  opcodes = {**opcodes, **swaps}
+  opcodes.update(swaps)
   return opcodes
 
 def _opcodes_dict_push_dup_swap(source, removeds, addeds, parameters):
@@ -173,12 +185,9 @@ def random_value_byte_size_push(value_size, byte_size):
   value = random.getrandbits(8*value_size)
   return byte_size_push(byte_size, value)
 
+# hex of the PUSHx opcode for every push size, i.e. 1 -> '60' (PUSH1)
+PUSH_OPCODES = tuple(f"{0x5f + push:02x}" for push in range(1, 33))
+
 def byte_size_push(byte_size, value):
-  value = hex(value)
-  value = value[2:]
-  if len(value) < 2*byte_size:
-    value = (2*byte_size-len(value))*'0' + value
-  # byte_size is also the OPCODE variant
-  op_num = 6 * 16 + byte_size - 1  # 0x60 is PUSH1
-  op = hex(op_num)[2:]
-  return op + value
+  # byte_size is also the OPCODE variant, the f-string formats and zero-pads in one pass
+  return PUSH_OPCODES[byte_size - 1] + f"{value:0{2*byte_size}x}"
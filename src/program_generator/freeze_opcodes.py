@@ -0,0 +1,39 @@
+import os
+import pprint
+
+from common import prepare_opcodes, get_selection
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+
+"""
+One-shot generator for `_opcodes_static.py`. The opcodes and selection CSVs never change at
+runtime, so their parsed form is frozen into a plain Python module which the generators can
+just import, instead of re-parsing the CSVs on startup. Re-run this after editing the CSVs:
+
+    python3 program_generator/freeze_opcodes.py
+"""
+
+HEADER = '''"""
+Static opcode tables, generated by `freeze_opcodes.py` from `data/opcodes.csv` and
+`data/selection.csv`. Do not edit by hand, re-run the generator after changing the CSVs.
+"""
+
+'''
+
+
+def main():
+  opcodes = prepare_opcodes(os.path.join(dir_path, 'data', 'opcodes.csv'))
+  selection = get_selection(os.path.join(dir_path, 'data', 'selection.csv'))
+
+  target = os.path.join(dir_path, '_opcodes_static.py')
+  with open(target, 'w') as static_file:
+    static_file.write(HEADER)
+    static_file.write('OPCODES = \\\n')
+    static_file.write(pprint.pformat(opcodes, sort_dicts=False))
+    static_file.write('\n\nSELECTION = \\\n')
+    static_file.write(pprint.pformat(selection))
+    static_file.write('\n')
+
+
+if __name__ == '__main__':
+  main()
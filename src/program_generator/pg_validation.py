@@ -1,25 +1,84 @@
 from distutils.command.clean import clean
+import collections
 import os
 import csv
 import fire
+import secrets
 import sys
-import random
+
+import numpy as np
 
 import constants
-from common import prepare_opcodes, get_selection, initial_mstore_bytecode, arity, jump_opcode_combo, byte_size_push
+from common import initial_mstore_bytecode, arity, jump_opcode_combo_at, byte_size_push
+# tables frozen out of data/opcodes.csv and data/selection.csv by freeze_opcodes.py
+from _opcodes_static import OPCODES, SELECTION
 
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
 
 
-class Program(object):
+class RandomPool(object):
   """
-  POD object for a program
+  Batched source of randomness backed by NumPy's PCG64. Randomness is pre-drawn in large
+  C-level batches and handed out via cursors, which is much cheaper than going through the
+  Python-level `random` module once per draw.
   """
 
-  def __init__(self, bytecode, dominant):
-    self.bytecode = bytecode
-    self.dominant = dominant
+  BYTES_BATCH = 1 << 16
+  INTS_BATCH = 1 << 12
+
+  def __init__(self, seed):
+    self._rng = np.random.default_rng(seed)
+    # without a seed there is nothing to reproduce, so bulk bytes can come straight from the
+    # OS: secrets.token_bytes batches a whole refill into a single getrandom(2) syscall
+    self._os_random = seed is None
+    self._bytes = b''
+    self._bytes_cursor = 0
+    self._ints = []
+    self._ints_cursor = 0
+    # `choice` index buffers, keyed by the length of the sequence drawn from
+    self._choices = {}
+
+  def randbytes(self, n):
+    if self._bytes_cursor + n > len(self._bytes):
+      if self._os_random:
+        self._bytes = secrets.token_bytes(max(n, RandomPool.BYTES_BATCH))
+      else:
+        self._bytes = self._rng.bytes(max(n, RandomPool.BYTES_BATCH))
+      self._bytes_cursor = 0
+    result = self._bytes[self._bytes_cursor:self._bytes_cursor + n]
+    self._bytes_cursor += n
+    return result
+
+  def uint32(self):
+    if self._ints_cursor >= len(self._ints):
+      # `tolist` converts to plain Python ints in bulk, keeping the per-draw cost to a list index
+      self._ints = self._rng.integers(1 << 32, size=RandomPool.INTS_BATCH, dtype=np.uint32).tolist()
+      self._ints_cursor = 0
+    result = self._ints[self._ints_cursor]
+    self._ints_cursor += 1
+    return result
+
+  def randint(self, a, b):
+    # both ends inclusive, as in `random.randint`. The modulo bias is negligible for the
+    # small ranges used here
+    return a + self.uint32() % (b - a + 1)
+
+  def choice(self, seq):
+    # indices are drawn a batch at a time per sequence length, so repeated choices from the
+    # same-sized sequence (the common case: all_ops, PUSH/DUP/SWAP variants) cost a list index
+    state = self._choices.get(len(seq))
+    if state is None or state[1] >= RandomPool.INTS_BATCH:
+      state = [self._rng.integers(len(seq), size=RandomPool.INTS_BATCH).tolist(), 0]
+      self._choices[len(seq)] = state
+    result = seq[state[0][state[1]]]
+    state[1] += 1
+    return result
+
+
+# POD record for a program. A namedtuple rather than a class: no per-instance __dict__ and
+# cheaper attribute access, which matters when generating many programs
+Program = collections.namedtuple('Program', ['bytecode', 'dominant'])
 
 
 class ProgramGenerator(object):
@@ -33,76 +92,81 @@ class ProgramGenerator(object):
 
   A sample usage `python3 program_generator/pg_validation.py generate --count=2 --opsLimit=100 --seed=123123123`
 
+  Passing `--seed=None` draws from OS entropy instead of a reproducible seeded stream
+
   NOTE: `measured_op_position` doesn't take into account the specific instructions fired before the
   generated part starts executing. It is relative to the first instruction of the _generated_ part
   of the program. E.g.: `evmone` prepends `JUMPDESTI`, `openethereum_ewasm` prepends many instructions
   """
 
   def __init__(self, seed=0):
-    random.seed(a=seed, version=2)
-
-    opcodes = prepare_opcodes(os.path.join(dir_path, 'data', 'opcodes.csv'))
-    selection = get_selection(os.path.join(dir_path, 'data', 'selection.csv'))
-
-    self._operations = {int(op, 16): opcodes[op] for op in selection}
-
-  # constant list of arithmetic operations
-  arithmetic_ops = [0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09]  # ADD MUL SUB DIV SDIV MOD SMOD ADDMOD MULMOD
-  exp_ops = [0x0a]  # EXP
-  bitwise_ops = [0x16, 0x17, 0x18, 0x19]  # AND OR XOR NOT
-  byte_ops = [0x1a, 0x0b]  # BYTE SIGNEXTEND
-  shift_ops = [0x1b, 0x1c, 0x1d]  # SHL, SHR, SAR
-  comparison_ops = [0x10, 0x11, 0x12, 0x13, 0x14]  # LT, GT, SLT, SGT, EQ
-  iszero_ops = [0x15]  # ISZERO
+    self._pool = RandomPool(seed)
+
+    self._operations = {int(op, 16): OPCODES[op] for op in SELECTION}
+
+    # per-opcode scalars precomputed here, so that the hot generation loop does single lookups
+    # instead of dict-of-dict accesses and str->int casts. `0xfe` INVALID has no stack data and
+    # is never drawn, skip it
+    drawable = {op: operation for op, operation in self._operations.items() if operation['Value'] != '0xfe'}
+    self._op_byte = {op: bytes((op,)) for op in drawable}
+    self._op_arity = {op: arity(operation) for op, operation in drawable.items()}
+    self._op_nreturns = {op: int(operation['Added to stack']) for op, operation in drawable.items()}
+    self._op_param = {op: bytes.fromhex(operation['Parameter']) for op, operation in drawable.items()
+                      if 'Parameter' in operation and operation['Parameter']}
+
+    # every program opens with the same memory preallocation and initial JUMP, assemble it once
+    initial_mstore = bytes.fromhex(initial_mstore_bytecode())
+    self._initial_bytes = initial_mstore + bytes.fromhex(jump_opcode_combo_at(len(initial_mstore), "56"))
+
+    # variant tuples keyed by op class marker, resolved with a single dict probe instead of
+    # chained string comparisons
+    self._class_variants = {
+      "PUSHclass": ProgramGenerator.push_ops,
+      "DUPclass": ProgramGenerator.dup_ops,
+      "SWAPclass": ProgramGenerator.swap_ops,
+    }
+
+  # constant categories of operations, frozensets so the per-iteration membership probes are O(1)
+  arithmetic_ops = frozenset([0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x09])  # ADD MUL SUB DIV SDIV MOD SMOD ADDMOD MULMOD
+  exp_ops = frozenset([0x0a])  # EXP
+  bitwise_ops = frozenset([0x16, 0x17, 0x18, 0x19])  # AND OR XOR NOT
+  byte_ops = frozenset([0x1a, 0x0b])  # BYTE SIGNEXTEND
+  shift_ops = frozenset([0x1b, 0x1c, 0x1d])  # SHL, SHR, SAR
+  comparison_ops = frozenset([0x10, 0x11, 0x12, 0x13, 0x14])  # LT, GT, SLT, SGT, EQ
+  iszero_ops = frozenset([0x15])  # ISZERO
   # ADDRESS, ORIGIN, CALLER, CALLVALUE, CODESIZE, GASPRICE, COINBASE, TIMESTAMP, NUMBER
   # DIFFICULTY, GASLIMIT, CHAINID, SELFBALANCE, PC, MSIZE, GAS
-  simple_nullary_ops = [0x30, 0x32, 0x33, 0x34, 0x38, 0x3a, 0x41, 0x42, 0x43,
-                        0x44, 0x45, 0x46, 0x47, 0x58, 0x59, 0x5a]
-  pop_ops = [0x50]
-  jumpdest_ops = [0x5b]  # JUMPDEST
+  simple_nullary_ops = frozenset([0x30, 0x32, 0x33, 0x34, 0x38, 0x3a, 0x41, 0x42, 0x43,
+                                  0x44, 0x45, 0x46, 0x47, 0x58, 0x59, 0x5a])
+  pop_ops = frozenset([0x50])
+  jumpdest_ops = frozenset([0x5b])  # JUMPDEST
 
-  push_ops = [0x60, 0x61, 0x62, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6a, 0x6b, 0x6c, 0x6d, 0x6e, 0x6f, 0x70, 0x71, 0x72, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78, 0x79, 0x7a, 0x7b, 0x7c, 0x7d, 0x7e, 0x7f]
-  dup_ops = [0x80, 0x81, 0x82, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89, 0x8a, 0x8b, 0x8c, 0x8d, 0x8e, 0x8f]
-  swap_ops = [0x90, 0x91, 0x92, 0x93, 0x94, 0x95, 0x96, 0x97, 0x98, 0x99, 0x9a, 0x9b, 0x9c, 0x9d, 0x9e, 0x9f]
+  # PUSH1..PUSH32, DUP1..DUP16, SWAP1..SWAP16 kept as tuples, the variant draws index into them
+  push_ops = tuple(range(0x60, 0x80))
+  dup_ops = tuple(range(0x80, 0x90))
+  swap_ops = tuple(range(0x90, 0xa0))
+  push_ops_set = frozenset(push_ops)
 
   # CALLDATALOAD, CALLDATASIZE, CALLDATACOPY, CODECOPY, MLOAD
-  memory_ops = [0x35, 0x36, 0x37, 0x39, 0x51]
-
-  mstore_ops = [0x52, 0x53]  # MSTORE, MSTORE8
-  jump_ops = [0x56, 0x57]  # JUMP, JUMPI
-  returndata_ops = [0x3d]  # RETURNDATASIZE
-
-  all_ops = []
-  all_ops.extend(arithmetic_ops)
-  all_ops.extend(exp_ops)
-  all_ops.extend(bitwise_ops)
-  all_ops.extend(byte_ops)
-  all_ops.extend(shift_ops)
-  all_ops.extend(comparison_ops)
-  all_ops.extend(iszero_ops)
-  all_ops.extend(simple_nullary_ops)
-  all_ops.extend(pop_ops)
-  all_ops.extend(jumpdest_ops)
-  all_ops.extend(memory_ops)
-  all_ops.extend(jump_ops)
-  all_ops.extend(mstore_ops)
-  all_ops.extend(returndata_ops)
+  memory_ops = frozenset([0x35, 0x36, 0x37, 0x39, 0x51])
+
+  mstore_ops = frozenset([0x52, 0x53])  # MSTORE, MSTORE8
+  jump_ops = frozenset([0x56, 0x57])  # JUMP, JUMPI
+  returndata_ops = frozenset([0x3d])  # RETURNDATASIZE
+
+  # flat tuple of everything drawable, for the uniform opcode draw. Sorted to make the
+  # index -> opcode mapping independent of set iteration order
   # PUSHes DUPs and SWAPs overwhelm the others if treated equally. We pick the class with probability as any
-  # other OPCODE, and then the variant is drawn in a subsequent `random.choice` with equal probability.
-  all_ops.append("PUSHclass")
-  all_ops.append("DUPclass")
-  all_ops.append("SWAPclass")
+  # other OPCODE, and then the variant is drawn in a subsequent `choice` with equal probability.
+  all_ops = tuple(sorted(arithmetic_ops | exp_ops | bitwise_ops | byte_ops | shift_ops |
+                         comparison_ops | iszero_ops | simple_nullary_ops | pop_ops |
+                         jumpdest_ops | memory_ops | jump_ops | mstore_ops | returndata_ops)) + \
+            ("PUSHclass", "DUPclass", "SWAPclass")
 
   def _resolve_op_class(self, op):
-
-    if op == "PUSHclass":
-      return random.choice(ProgramGenerator.push_ops)  
-    elif op == "DUPclass":
-      return random.choice(ProgramGenerator.dup_ops)
-    elif op == "SWAPclass":
-      return random.choice(ProgramGenerator.swap_ops)
-    else:
-      return op
+    if isinstance(op, str):
+      return self._pool.choice(self._class_variants[op])
+    return op
 
   def generate(self, fullCsv=False, count=1, opsLimit=None, bytecodeLimit=None, dominant=None, push=32, cleanStack=False, randomizePush=False, randomizeOpsLimit=False):
     """
@@ -131,39 +195,49 @@ class ProgramGenerator(object):
     
     dominant_choice = dominant
 
-    programs = []
-    for i in range(count):
-      if randomizeOpsLimit:
-        opsLimit = random.randint(1, opsLimitMax)
-      else:
-        opsLimit = opsLimitMax
-
-      if dominant_choice == 'random':
-        dominant = random.choice(ProgramGenerator.all_ops)
-        dominant = self._resolve_op_class(dominant)
-      else:
-        dominant = dominant_choice
-
-      program = self._generate_random_arithmetic(opsLimit, bytecodeLimit, dominant, push, cleanStack, randomizePush)
-      programs.append(program)
+    # programs are generated lazily and written out one at a time, so peak memory doesn't
+    # grow with `count`
+    programs = self._generate_programs(count, opsLimitMax, randomizeOpsLimit, bytecodeLimit,
+                                       dominant_choice, push, cleanStack, randomizePush)
 
     if fullCsv:
       writer = csv.writer(sys.stdout, delimiter=',', quotechar='"')
 
-      program_ids = [i for i, program in enumerate(programs)]
-      bytecodes = [program.bytecode for program in programs]
-      dominants = [program.dominant for program in programs]
-
       header = ['program_id', 'bytecode', 'dominant']
       writer.writerow(header)
 
-      rows = zip(program_ids, bytecodes, dominants)
-      for row in rows:
-        writer.writerow(row)
+      for program_id, program in enumerate(programs):
+        writer.writerow((program_id, program.bytecode, program.dominant))
     else:
       for program in programs:
         print(program.bytecode)
 
+  def _generate_programs(self, count, opsLimitMax, randomizeOpsLimit, bytecodeLimit, dominant_choice, push, cleanStack, randomizePush):
+    """
+    Yields `count` programs one by one
+    """
+    # a fixed dominant keeps its mnemonic for every program, resolve it once up front
+    if dominant_choice and dominant_choice != 'random':
+      dominant_mnemonic = self._operations[dominant_choice]['Mnemonic']
+    else:
+      dominant_mnemonic = None
+
+    for i in range(count):
+      if randomizeOpsLimit:
+        opsLimit = self._pool.randint(1, opsLimitMax)
+      else:
+        opsLimit = opsLimitMax
+
+      if dominant_choice == 'random':
+        dominant = self._pool.choice(ProgramGenerator.all_ops)
+        dominant = self._resolve_op_class(dominant)
+        dominant_mnemonic = self._operations[dominant]['Mnemonic']
+      else:
+        dominant = dominant_choice
+
+      bytecode = self._generate_random_arithmetic(opsLimit, bytecodeLimit, dominant, push, cleanStack, randomizePush)
+      yield Program(bytecode, dominant_mnemonic)
+
   def _generate_random_arithmetic(self, opsLimit, bytecodeLimit, dominant, pushMax, cleanStack, randomizePush):
     """
     Generates one large programs with multiple arithmetic operations
@@ -172,106 +246,225 @@ class ProgramGenerator(object):
     if pushMax < 1 or pushMax > 32:
       raise ValueError(pushMax)
 
-    # generated bytecode
-    bytecode = ''
-    # always preallocate memory to avoid uneven amount of allocation later
-    bytecode += initial_mstore_bytecode()
-    # always include at least one JUMP
-    bytecode += jump_opcode_combo(bytecode, "56")
+    # dispatch the common fast-path configuration to its specialized twin
+    if pushMax == 32 and not randomizePush and cleanStack and not dominant:
+      return self._generate_random_arithmetic_fast(opsLimit, bytecodeLimit)
+
+    # generated bytecode, accumulated as raw bytes and hex-encoded once at the end. The buffer
+    # is pre-sized to the estimated final length -- at most 33 bytes (PUSH32 + value) per counted
+    # operation -- and filled through a `pos` cursor, so it doesn't reallocate while growing.
+    # Slice assignment extends the buffer in the rare case the estimate falls short
+    if bytecodeLimit:
+      capacity = bytecodeLimit + 64
+    else:
+      capacity = len(self._initial_bytes) + 33 * opsLimit + 64
+    buf = bytearray(capacity)
+    # starts with the precomputed memory preallocation and initial JUMP
+    pos = len(self._initial_bytes)
+    buf[0:pos] = self._initial_bytes
     # number of operations including pushes
     ops_count = 0
     if not cleanStack:
       previous_nreturns = 0
 
-    while (not opsLimit or ops_count < opsLimit) and (not bytecodeLimit or len(bytecode)<2*bytecodeLimit):
+    # the default configuration (full-width pushes, not randomized) dominates, bind the
+    # specialized helpers once so the loop skips the size branch on every push
+    if pushMax == 32 and not randomizePush:
+      random_push = self._random_push32
+      random_pushes = self._random_pushes32
+    else:
+      random_push = lambda: self._random_push(pushMax, randomizePush)
+      random_pushes = lambda count: b''.join(self._random_push(pushMax, randomizePush) for _ in range(count))
+
+    # see _generate_random_arithmetic_fast for the rationale of the hoisted limits
+    ops_limit = opsLimit if opsLimit else float('inf')
+    bc_limit = bytecodeLimit if bytecodeLimit else float('inf')
+
+    while ops_count < ops_limit and pos < bc_limit:
       if dominant:
-        if random.random() < 0.5:
+        # a single draw serves both: the top bit is the ~0.5 coin for picking the dominant,
+        # the remaining bits are the uniform index into all_ops
+        draw = self._pool.uint32()
+        if draw & 0x80000000:
           op = dominant
         else:
-          op = random.choice(ProgramGenerator.all_ops)
+          op = ProgramGenerator.all_ops[draw % len(ProgramGenerator.all_ops)]
       else:
-        op = random.choice(ProgramGenerator.all_ops)
+        op = self._pool.choice(ProgramGenerator.all_ops)
 
-      op = self._resolve_op_class(op)
+      # _resolve_op_class inlined, the class markers are the only strings in all_ops
+      if isinstance(op, str):
+        op = self._pool.choice(self._class_variants[op])
 
-      operation = self._operations[op]
-      nreturns = int(operation['Added to stack'])
+      nreturns = self._op_nreturns[op]
 
       # determine how many args we need to push on the stack and push
       # some value have remained on the stack, unless we're in `cleanStack` mode, whereby they had been popped
-      needed_pushes = arity(operation) if cleanStack else (arity(operation) - previous_nreturns)
-      # i.e. 23 from 0x23
-      opcode = operation['Value'][2:4]
+      needed_pushes = self._op_arity[op] if cleanStack else (self._op_arity[op] - previous_nreturns)
       if op in ProgramGenerator.byte_ops:  # BYTE SIGNEXTEND needs 0-31 value on the top of the stack
-        bytecode += self._random_push(pushMax, randomizePush) if cleanStack or previous_nreturns == 0 else ""
-        bytecode += self._random_push_less_32()
+        if cleanStack or previous_nreturns == 0:
+          chunk = random_push()
+          buf[pos:pos + len(chunk)] = chunk
+          pos += len(chunk)
+        chunk = self._random_push_less_32()
+        buf[pos:pos + len(chunk)] = chunk
+        pos += len(chunk)
       elif op in ProgramGenerator.shift_ops:  # SHL, SHR, SAR need 0-255 value on the top of the stack
-        bytecode += self._random_push(pushMax, randomizePush) if cleanStack or previous_nreturns == 0 else ""
-        bytecode += self._random_push(1, False)
+        if cleanStack or previous_nreturns == 0:
+          chunk = random_push()
+          buf[pos:pos + len(chunk)] = chunk
+          pos += len(chunk)
+        chunk = self._random_push(1, False)
+        buf[pos:pos + len(chunk)] = chunk
+        pos += len(chunk)
       elif op in ProgramGenerator.memory_ops:
         # `cleanStack` is assumed here, otherwise memory OPCODEs might malfunction on arbitrarily large arguments
         assert cleanStack
         # argument btw 0 and 16KB
-        bytecode += ''.join([byte_size_push(2, random.randint(0, (1<<14) - 1)) for _ in range(needed_pushes)])
+        chunk = b''.join(bytes.fromhex(byte_size_push(2, self._pool.randint(0, (1<<14) - 1)))
+                         for _ in range(needed_pushes))
+        buf[pos:pos + len(chunk)] = chunk
+        pos += len(chunk)
       elif op in ProgramGenerator.mstore_ops:
         # `cleanStack` is assumed here, otherwise memory OPCODEs might malfunction on arbitrarily large arguments
         assert cleanStack
         # first arg is the stored value, then offset
-        bytecode += self._random_push(pushMax, randomizePush)
-        bytecode += byte_size_push(2, random.randint(0, (1<<14) - 1))
+        chunk = random_push()
+        buf[pos:pos + len(chunk)] = chunk
+        pos += len(chunk)
+        chunk = bytes.fromhex(byte_size_push(2, self._pool.randint(0, (1<<14) - 1)))
+        buf[pos:pos + len(chunk)] = chunk
+        pos += len(chunk)
       else:
         # JUMP AND JUMPI are happy to fall in here, as they have their arity (needed pushes) reduced
         # we'll push their destinations later
-        bytecode += ''.join([self._random_push(pushMax, randomizePush) for _ in range(needed_pushes)])
+        if needed_pushes > 0:
+          chunk = random_pushes(needed_pushes)
+          buf[pos:pos + len(chunk)] = chunk
+          pos += len(chunk)
       ops_count += needed_pushes
 
       if op in ProgramGenerator.jump_ops:
-        bytecode += jump_opcode_combo(bytecode, opcode)
+        chunk = bytes.fromhex(jump_opcode_combo_at(pos, '%02x' % op))
+        buf[pos:pos + len(chunk)] = chunk
+        pos += len(chunk)
         ops_count += 3
       else:
-        bytecode += opcode
+        chunk = self._op_byte[op]
+        buf[pos:pos + len(chunk)] = chunk
+        pos += len(chunk)
         ops_count += 1
 
-      if op in ProgramGenerator.push_ops:
-        bytecode += operation['Parameter']
+      if op in ProgramGenerator.push_ops_set:
+        chunk = self._op_param[op]
+        buf[pos:pos + len(chunk)] = chunk
+        pos += len(chunk)
 
       # Pop any results to keep the stack clean for the next iteration. Otherwise mark how many returns remain on
       # the stack after the OPCODE executed.
       if cleanStack:
         # empty the stack
-        bytecode += '50' * nreturns  # POP
+        chunk = b'\x50' * nreturns  # POPs
+        buf[pos:pos + len(chunk)] = chunk
+        pos += len(chunk)
         ops_count += nreturns
       else:
         previous_nreturns = nreturns
 
     final_unreachable_placeholder = 'unreachable'
-    bytecode += final_unreachable_placeholder
+    del buf[pos:]
+    return buf.hex() + final_unreachable_placeholder
 
-    return Program(bytecode, self._operations[dominant]['Mnemonic'] if dominant else None)
+  def _generate_random_arithmetic_fast(self, opsLimit, bytecodeLimit):
+    """
+    Specialization of _generate_random_arithmetic for the common configuration (full-width
+    pushes, not randomized, cleanStack, no dominant): all the configuration branches are
+    evaluated away and the hot names are bound to locals, the loop only draws and emits.
+    Produces the same bytecode as the general version would for this configuration
+    """
+    if bytecodeLimit:
+      capacity = bytecodeLimit + 64
+    else:
+      capacity = len(self._initial_bytes) + 33 * opsLimit + 64
+    buf = bytearray(capacity)
+    pos = len(self._initial_bytes)
+    buf[0:pos] = self._initial_bytes
+    ops_count = 0
+
+    pool = self._pool
+    all_ops = ProgramGenerator.all_ops
+    op_arity = self._op_arity
+    op_nreturns = self._op_nreturns
+
+    # the limits never change while generating; unset ones become infinity so the loop
+    # condition is two plain comparisons instead of truthiness tests per iteration
+    ops_limit = opsLimit if opsLimit else float('inf')
+    bc_limit = bytecodeLimit if bytecodeLimit else float('inf')
+
+    while ops_count < ops_limit and pos < bc_limit:
+      op = pool.choice(all_ops)
+      if isinstance(op, str):
+        op = pool.choice(self._class_variants[op])
+
+      nreturns = op_nreturns[op]
+      needed_pushes = op_arity[op]
+      if op in ProgramGenerator.byte_ops:
+        chunk = b'\x7f' + pool.randbytes(32) + pool.choice(ProgramGenerator._LT32)
+      elif op in ProgramGenerator.shift_ops:
+        chunk = b'\x7f' + pool.randbytes(32) + b'\x60' + pool.randbytes(1)
+      elif op in ProgramGenerator.memory_ops:
+        chunk = b''.join(bytes.fromhex(byte_size_push(2, pool.randint(0, (1<<14) - 1)))
+                         for _ in range(needed_pushes))
+      elif op in ProgramGenerator.mstore_ops:
+        chunk = b'\x7f' + pool.randbytes(32) + bytes.fromhex(byte_size_push(2, pool.randint(0, (1<<14) - 1)))
+      elif needed_pushes > 0:
+        chunk = self._random_pushes32(needed_pushes)
+      else:
+        chunk = b''
+      buf[pos:pos + len(chunk)] = chunk
+      pos += len(chunk)
+      ops_count += needed_pushes
+
+      if op in ProgramGenerator.jump_ops:
+        chunk = bytes.fromhex(jump_opcode_combo_at(pos, '%02x' % op))
+        ops_count += 3
+      else:
+        chunk = self._op_byte[op]
+        ops_count += 1
+      if op in ProgramGenerator.push_ops_set:
+        chunk += self._op_param[op]
+      chunk += b'\x50' * nreturns  # POPs
+      ops_count += nreturns
+      buf[pos:pos + len(chunk)] = chunk
+      pos += len(chunk)
+
+    del buf[pos:]
+    return buf.hex() + 'unreachable'
+
+  # the PUSHx opcode byte for every push size, i.e. index 0 -> b'\x60' (PUSH1)
+  _PUSH_PREFIX = tuple(bytes((0x5f + push,)) for push in range(1, 33))
+  # all the PUSH1s of values 0..31, i.e. b'\x60\x00'..b'\x60\x1f'
+  _LT32 = tuple(bytes((0x60, value)) for value in range(32))
 
   # TODO deprecate in favor of functions from common.py
   def _random_push(self, pushMax, randomizePush):
     if randomizePush:
-      push = random.randint(1, pushMax)
+      push = self._pool.randint(1, pushMax)
     else:
       push = pushMax
 
-    value = random.getrandbits(8*push)
-    value = hex(value)
-    value = value[2:]
-    if len(value) < 2*push:
-      value = (2*push-len(value))*'0' + value
-    op_num = 6 * 16 + push - 1  # 0x60 is PUSH1
-    op = hex(op_num)[2:]
-    return op + value
+    return ProgramGenerator._PUSH_PREFIX[push - 1] + self._pool.randbytes(push)
+
+  def _random_push32(self):
+    return b'\x7f' + self._pool.randbytes(32)  # PUSH32
+
+  def _random_pushes32(self, count):
+    # all the push values come out of one pool draw, with the PUSH32 prefixes interleaved
+    blob = self._pool.randbytes(32 * count)
+    return b''.join(b'\x7f' + blob[start:start + 32] for start in range(0, 32 * count, 32))
 
   def _random_push_less_32(self):
-    value = random.randint(0, 31)
-    value = hex(value)
-    value = value[2:]
-    if len(value) < 2:
-      value = (2-len(value))*'0' + value
-    return '60' + value
+    return self._pool.choice(ProgramGenerator._LT32)
 
 def main():
   fire.Fire(ProgramGenerator, name='generate')